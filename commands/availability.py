@@ -1,3 +1,5 @@
+import heapq
+from itertools import islice
 from zoneinfo import available_timezones
 
 import discord
@@ -5,10 +7,9 @@ from discord import app_commands
 from discord.ext import commands
 
 from commands.helpers import EMBED_COLOR, fmt_day, fmt_time
-from state import DAY_KEYS, Database, validate_time
+from state import DAY_KEYS, Database, validate_time, validate_timezone
 
 _ALL_TIMEZONES = sorted(available_timezones())
-_ALL_TIMEZONES_SET = set(_ALL_TIMEZONES)
 
 # Common abbreviations -> IANA timezone for autocomplete friendliness
 _TZ_ALIASES: dict[str, str] = {
@@ -25,8 +26,27 @@ _TZ_ALIASES: dict[str, str] = {
     "JST": "Asia/Tokyo",
     "AEST": "Australia/Sydney", "AEDT": "Australia/Sydney",
 }
-# Build searchable list: (display_name, iana_value)
-_TZ_ALIAS_ENTRIES = [(f"{abbr} — {iana}", iana) for abbr, iana in _TZ_ALIASES.items()]
+# One flat search catalog built at import: aliases first (rank 0), then plain
+# IANA zones (rank 1), each entry (lowercased_display, rank, display, value)
+_TZ_ENTRIES = [
+    (f"{abbr} — {iana}".lower(), 0, f"{abbr} — {iana}", iana)
+    for abbr, iana in _TZ_ALIASES.items()
+] + [(tz.lower(), 1, tz, tz) for tz in _ALL_TIMEZONES]
+# An IANA value can appear both bare and behind several aliases; pulling this
+# many candidates before deduplicating always leaves 25 distinct values
+_TZ_CANDIDATES = 25 + sum(1 for e in _TZ_ENTRIES if e[1] == 0)
+
+# Shown before the user has typed anything: the 25 most commonly picked zones,
+# so the empty-input case returns a canned list instead of scanning the catalog
+_POPULAR_TIMEZONES = [
+    "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
+    "America/Anchorage", "Pacific/Honolulu", "America/Toronto", "America/Vancouver",
+    "America/Mexico_City", "America/Sao_Paulo", "America/Argentina/Buenos_Aires",
+    "Europe/London", "Europe/Paris", "Europe/Berlin", "Europe/Madrid", "Europe/Rome",
+    "Europe/Stockholm", "Europe/Bucharest", "Europe/Moscow", "Asia/Kolkata",
+    "Asia/Shanghai", "Asia/Tokyo", "Asia/Seoul", "Australia/Sydney", "Pacific/Auckland",
+]
+_DEFAULT_TZ_CHOICES = [app_commands.Choice(name=tz, value=tz) for tz in _POPULAR_TIMEZONES]
 
 DAY_CHOICES = [app_commands.Choice(name=fmt_day(d), value=d) for d in DAY_KEYS]
 
@@ -35,39 +55,51 @@ _TIME_CHOICES = []
 for _h in range(24):
     for _m in (0, 15, 30, 45):
         _val = f"{_h:02d}:{_m:02d}"
-        _TIME_CHOICES.append((_val, fmt_time(_val)))
+        _TIME_CHOICES.append((_val, fmt_time(_val), fmt_time(_val).lower()))
+
+_DEFAULT_TIME_CHOICES = [
+    app_commands.Choice(name=display, value=val)
+    for val, display, _ in _TIME_CHOICES[:25]
+]
 
 
 async def autocomplete_time(
     interaction: discord.Interaction, current: str,
 ) -> list[app_commands.Choice[str]]:
     lower = current.lower().strip()
-    return [
+    if not lower:
+        return _DEFAULT_TIME_CHOICES
+    matches = (
         app_commands.Choice(name=display, value=val)
-        for val, display in _TIME_CHOICES
-        if lower in display.lower() or lower in val
-    ][:25]
+        for val, display, display_lower in _TIME_CHOICES
+        if lower in display_lower or lower in val
+    )
+    return list(islice(matches, 25))
 
 
 async def autocomplete_timezone(
     interaction: discord.Interaction, current: str,
 ) -> list[app_commands.Choice[str]]:
-    lower = current.lower()
+    # Tolerate pasted values like " America/New_York " or iCal-style "/PST"
+    lower = current.strip().lstrip("/").lower()
+    if not lower:
+        return _DEFAULT_TZ_CHOICES
+    # Single pass: prefix matches outrank substring matches, aliases outrank
+    # plain zones, shorter names outrank longer ones
+    matches = [
+        (0 if key.startswith(lower) else 1, rank, len(key), key, display, value)
+        for key, rank, display, value in _TZ_ENTRIES
+        if lower in key
+    ]
     results: list[app_commands.Choice[str]] = []
     seen: set[str] = set()
-    # Abbreviation matches first (PST, Eastern, etc.)
-    for display, iana in _TZ_ALIAS_ENTRIES:
-        if lower in display.lower() and iana not in seen:
-            results.append(app_commands.Choice(name=display, value=iana))
-            seen.add(iana)
-    # Then standard IANA matches
-    for tz in _ALL_TIMEZONES:
-        if lower in tz.lower() and tz not in seen:
-            results.append(app_commands.Choice(name=tz, value=tz))
-            seen.add(tz)
-        if len(results) >= 25:
-            break
-    return results[:25]
+    for _, _, _, _, display, value in heapq.nsmallest(_TZ_CANDIDATES, matches):
+        if value not in seen:
+            seen.add(value)
+            results.append(app_commands.Choice(name=display, value=value))
+            if len(results) == 25:
+                break
+    return results
 
 
 class AvailabilityCog(commands.Cog):
@@ -82,7 +114,8 @@ class AvailabilityCog(commands.Cog):
     @app_commands.describe(timezone="Your timezone (e.g. PST, Eastern, Europe/London)")
     @app_commands.autocomplete(timezone=autocomplete_timezone)
     async def set_timezone(self, interaction: discord.Interaction, timezone: str) -> None:
-        if timezone not in _ALL_TIMEZONES_SET:
+        timezone = timezone.strip().lstrip("/")
+        if not validate_timezone(timezone):
             await interaction.response.send_message(
                 f'"{timezone}" is not a valid timezone. Start typing to see suggestions.', ephemeral=True,
             )
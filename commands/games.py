@@ -2,12 +2,12 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from commands.helpers import autocomplete_all_games, autocomplete_user_games, get_bot, EMBED_COLOR
+from commands.helpers import autocomplete_all_games, autocomplete_user_games, EMBED_COLOR
 from state import Database
 
 
 class RemoveGameSelect(discord.ui.Select):
-    def __init__(self, games: list[str]) -> None:
+    def __init__(self, db: Database, games: list[str]) -> None:
         options = [discord.SelectOption(label=game, value=game) for game in games[:25]]
         super().__init__(
             placeholder="Select a game to remove...",
@@ -15,12 +15,12 @@ class RemoveGameSelect(discord.ui.Select):
             max_values=1,
             options=options,
         )
+        self.db = db
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        bot = get_bot(interaction)
         selected_game = self.values[0]
 
-        removed = bot.db.remove_game(interaction.user.id, selected_game)
+        removed = self.db.remove_game(interaction.user.id, selected_game)
         if removed:
             message = f'Removed "{selected_game}" from your games.'
         else:
@@ -31,10 +31,10 @@ class RemoveGameSelect(discord.ui.Select):
 
 
 class RemoveGameView(discord.ui.View):
-    def __init__(self, games: list[str], owner_id: int) -> None:
+    def __init__(self, db: Database, games: list[str], owner_id: int) -> None:
         super().__init__(timeout=60)
         self.owner_id = owner_id
-        self.add_item(RemoveGameSelect(games))
+        self.add_item(RemoveGameSelect(db, games))
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.owner_id:
@@ -82,7 +82,7 @@ class GamesCog(commands.Cog):
         if not games:
             await interaction.response.send_message("You don't have any games saved.", ephemeral=True)
             return
-        view = RemoveGameView(games, interaction.user.id)
+        view = RemoveGameView(self.db, games, interaction.user.id)
         await interaction.response.send_message("Select a game to remove:", view=view, ephemeral=True)
         view.message = await interaction.original_response()
 
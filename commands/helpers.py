@@ -38,10 +38,8 @@ def setup_hints(db: Database, user_id: int) -> list[str]:
         hints.append("Add games with `/add-game`")
     if not db.get_timezone(user_id):
         hints.append("Set your timezone with `/set-timezone`")
-    else:
-        avail = db.get_availability(user_id)
-        if not any(avail.values()):
-            hints.append("Set your availability with `/set-availability`")
+    elif not db.has_any_availability(user_id):
+        hints.append("Set your availability with `/set-availability`")
     return hints
 
 
@@ -54,17 +52,39 @@ def get_bot(interaction: discord.Interaction) -> BotClient:
     return cast(BotClient, interaction.client)
 
 
+def _game_choices(
+    games: list[str], current: str, games_lower: list[str] | None = None,
+) -> list[app_commands.Choice[str]]:
+    """Build up to 25 choices, ranking prefix matches ahead of substring matches.
+
+    games_lower, when given, is a pre-lowercased twin of games so the matcher
+    skips the per-entry .lower() call.
+    """
+    if not current:
+        return [app_commands.Choice(name=g, value=g) for g in games[:25]]
+    lower = current.lower()
+    if games_lower is None:
+        games_lower = [g.lower() for g in games]
+    prefix: list[str] = []
+    substring: list[str] = []
+    for g, g_lower in zip(games, games_lower):
+        if g_lower.startswith(lower):
+            prefix.append(g)
+            if len(prefix) == 25:
+                break
+        elif len(substring) < 25 and lower in g_lower:
+            substring.append(g)
+    matched = prefix + substring[: 25 - len(prefix)]
+    return [app_commands.Choice(name=g, value=g) for g in matched]
+
+
 async def autocomplete_user_games(
     interaction: discord.Interaction, current: str,
 ) -> list[app_commands.Choice[str]]:
     """Suggest from the invoker's own game list."""
     bot = get_bot(interaction)
     games = bot.db.list_games(interaction.user.id)
-    lower = current.lower()
-    return [
-        app_commands.Choice(name=g, value=g)
-        for g in games if lower in g.lower()
-    ][:25]
+    return _game_choices(games, current)
 
 
 async def autocomplete_all_games(
@@ -72,9 +92,5 @@ async def autocomplete_all_games(
 ) -> list[app_commands.Choice[str]]:
     """Suggest from all known games across all users."""
     bot = get_bot(interaction)
-    games = bot.db.all_game_names()
-    lower = current.lower()
-    return [
-        app_commands.Choice(name=g, value=g)
-        for g in games if lower in g.lower()
-    ][:25]
+    games, games_lower = bot.db.search_game_names()
+    return _game_choices(games, current, games_lower)
@@ -37,10 +37,17 @@ class MatchmakingCog(commands.Cog):
             await interaction.response.send_message(message, ephemeral=True)
             return
 
+        # Keep the embed readable (and under Discord's description limit)
+        extra = len(matches) - 25
+        if extra > 0:
+            matches = matches[:25]
+
         lines: list[str] = []
         for user_id, common in matches:
             games_str = ", ".join(common)
             lines.append(f"<@{user_id}> — {games_str}")
+        if extra > 0:
+            lines.append(f"…and {extra} more")
 
         embed = discord.Embed(
             title="Players Available Now",
@@ -1,9 +1,11 @@
+from functools import lru_cache
 from itertools import groupby
+from operator import itemgetter
 import logging
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, available_timezones
 
 log = logging.getLogger(__name__)
 
@@ -46,32 +48,100 @@ _MIGRATIONS: list[str] = [
     """
     ALTER TABLE users ADD COLUMN snooze_until TEXT;
     """,
+    # v5: index normalized game names so cross-user lookups (who-plays,
+    # common-games joins) don't scan the whole games table
+    """
+    CREATE INDEX IF NOT EXISTS idx_games_normalized ON games(normalized);
+    """,
+    # v6: store user IDs as INTEGER instead of TEXT. Discord IDs arrive as
+    # ints; TEXT keys forced a str() on every write and an int() on every
+    # read. SQLite can't alter column types, so rebuild the tables
+    # (foreign_keys must be off while the old parents are dropped).
+    """
+    PRAGMA foreign_keys=OFF;
+    CREATE TABLE users_new (
+        user_id INTEGER PRIMARY KEY,
+        timezone TEXT,
+        snooze_until TEXT
+    );
+    INSERT INTO users_new SELECT CAST(user_id AS INTEGER), timezone, snooze_until FROM users;
+    CREATE TABLE games_new (
+        user_id INTEGER NOT NULL,
+        game_name TEXT NOT NULL,
+        normalized TEXT NOT NULL,
+        PRIMARY KEY (user_id, normalized),
+        FOREIGN KEY (user_id) REFERENCES users(user_id)
+    );
+    INSERT INTO games_new SELECT CAST(user_id AS INTEGER), game_name, normalized FROM games ORDER BY rowid;
+    CREATE TABLE availability_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        day TEXT NOT NULL,
+        start_time TEXT NOT NULL,
+        end_time TEXT NOT NULL,
+        FOREIGN KEY (user_id) REFERENCES users(user_id)
+    );
+    INSERT INTO availability_new (id, user_id, day, start_time, end_time)
+        SELECT id, CAST(user_id AS INTEGER), day, start_time, end_time FROM availability;
+    DROP TABLE games;
+    DROP TABLE availability;
+    DROP TABLE users;
+    ALTER TABLE users_new RENAME TO users;
+    ALTER TABLE games_new RENAME TO games;
+    ALTER TABLE availability_new RENAME TO availability;
+    CREATE INDEX IF NOT EXISTS idx_availability_user_day ON availability(user_id, day);
+    CREATE INDEX IF NOT EXISTS idx_games_normalized ON games(normalized);
+    PRAGMA foreign_keys=ON;
+    """,
 ]
 
 
+# Every whitespace codepoint str.split() treats as a separator (the highest
+# is U+3000 IDEOGRAPHIC SPACE), mapped to deletion
+_WS_STRIP = str.maketrans({c: None for c in map(chr, range(0x3001)) if c.isspace()})
+
+
+@lru_cache(maxsize=4096)
 def normalize_game_name(name: str) -> str:
     """Lowercase the name and remove all whitespace."""
-    return "".join(name.split()).lower()
+    return name.translate(_WS_STRIP).lower()
+
+
+# Built once at import: available_timezones() enumerates the tzdata tree and
+# allocates a fresh set on every call
+_VALID_TIMEZONES: frozenset[str] = frozenset(available_timezones())
+
+
+def validate_timezone(tz: str) -> bool:
+    """Return True if tz is a known IANA timezone name."""
+    return tz in _VALID_TIMEZONES
 
 
 def validate_time(t: str) -> bool:
     """Return True if t is a valid HH:MM time string (including 24:00)."""
+    if len(t) != 5 or t[2] != ":":
+        return False
     if t == "24:00":
         return True
-    try:
-        datetime.strptime(t, "%H:%M")
-        return True
-    except ValueError:
+    # isascii rejects non-decimal "digits" (e.g. superscripts) that isdigit
+    # accepts but int() raises on
+    if not t.isascii():
         return False
+    h, m = t[:2], t[3:]
+    return h.isdigit() and m.isdigit() and int(h) < 24 and int(m) < 60
 
 
 def _empty_availability() -> dict[str, list[dict[str, str]]]:
     return {day: [] for day in DAY_KEYS}
 
 
-def _uid(user_id: int) -> str:
-    """Central conversion of Discord user ID to DB string key."""
-    return str(user_id)
+@lru_cache(maxsize=1024)
+def _zoneinfo(tz_name: str) -> ZoneInfo | None:
+    """Cached ZoneInfo lookup; returns None for unknown names instead of raising."""
+    try:
+        return ZoneInfo(tz_name)
+    except (KeyError, ValueError):
+        return None
 
 
 def _slots_overlap(s1_start: str, s1_end: str, s2_start: str, s2_end: str) -> bool:
@@ -89,7 +159,16 @@ class Database:
         path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(path)
         self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL safe from corruption; avoids an fsync per commit
+        # under bursty command traffic
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self.conn.execute("PRAGMA foreign_keys=ON")
+        # Per-user game lists and the global catalog (with a pre-lowercased
+        # twin for matching), invalidated on add/remove; autocomplete reads
+        # these once per keystroke
+        self._games_cache: dict[int, list[str]] = {}
+        self._all_games_cache: list[str] | None = None
+        self._all_games_lower: list[str] | None = None
         self._migrate()
 
     def _migrate(self) -> None:
@@ -116,7 +195,7 @@ class Database:
     def _ensure_user(self, user_id: int) -> None:
         self.conn.execute(
             "INSERT OR IGNORE INTO users (user_id) VALUES (?)",
-            (_uid(user_id),),
+            (user_id,),
         )
 
     # --- Snooze ---
@@ -125,20 +204,20 @@ class Database:
         self._ensure_user(user_id)
         self.conn.execute(
             "UPDATE users SET snooze_until = ? WHERE user_id = ?",
-            (until_utc.strftime("%Y-%m-%dT%H:%M"), _uid(user_id)),
+            (until_utc.strftime("%Y-%m-%dT%H:%M"), user_id),
         )
         self.conn.commit()
 
     def clear_snooze(self, user_id: int) -> None:
         self.conn.execute(
             "UPDATE users SET snooze_until = NULL WHERE user_id = ?",
-            (_uid(user_id),),
+            (user_id,),
         )
         self.conn.commit()
 
     def is_snoozed(self, user_id: int, now_utc: datetime) -> bool:
         row = self.conn.execute(
-            "SELECT snooze_until FROM users WHERE user_id = ?", (_uid(user_id),),
+            "SELECT snooze_until FROM users WHERE user_id = ?", (user_id,),
         ).fetchone()
         if not row or not row[0]:
             return False
@@ -146,7 +225,7 @@ class Database:
 
     def get_snooze_until(self, user_id: int) -> str | None:
         row = self.conn.execute(
-            "SELECT snooze_until FROM users WHERE user_id = ?", (_uid(user_id),),
+            "SELECT snooze_until FROM users WHERE user_id = ?", (user_id,),
         ).fetchone()
         return row[0] if row else None
 
@@ -158,25 +237,32 @@ class Database:
         self.conn.execute(
             "INSERT INTO games (user_id, game_name, normalized) VALUES (?, ?, ?) "
             "ON CONFLICT (user_id, normalized) DO UPDATE SET game_name = excluded.game_name",
-            (_uid(user_id), game_name, normalized),
+            (user_id, game_name, normalized),
         )
         self.conn.commit()
+        self._games_cache.pop(user_id, None)
+        self._all_games_cache = self._all_games_lower = None
 
     def remove_game(self, user_id: int, game_name: str) -> bool:
         normalized = normalize_game_name(game_name)
         cur = self.conn.execute(
             "DELETE FROM games WHERE user_id = ? AND normalized = ?",
-            (_uid(user_id), normalized),
+            (user_id, normalized),
         )
         self.conn.commit()
+        self._games_cache.pop(user_id, None)
+        self._all_games_cache = self._all_games_lower = None
         return cur.rowcount > 0
 
     def list_games(self, user_id: int) -> list[str]:
-        rows = self.conn.execute(
-            "SELECT game_name FROM games WHERE user_id = ? ORDER BY rowid",
-            (_uid(user_id),),
-        ).fetchall()
-        return [r[0] for r in rows]
+        cached = self._games_cache.get(user_id)
+        if cached is None:
+            rows = self.conn.execute(
+                "SELECT game_name FROM games WHERE user_id = ? ORDER BY rowid",
+                (user_id,),
+            ).fetchall()
+            cached = self._games_cache[user_id] = [r[0] for r in rows]
+        return list(cached)
 
     def get_common_games(self, user_id_a: int, user_id_b: int) -> list[str]:
         rows = self.conn.execute(
@@ -184,7 +270,7 @@ class Database:
             "JOIN games b ON a.normalized = b.normalized "
             "WHERE a.user_id = ? AND b.user_id = ? "
             "ORDER BY a.rowid",
-            (_uid(user_id_a), _uid(user_id_b)),
+            (user_id_a, user_id_b),
         ).fetchall()
         return [r[0] for r in rows]
 
@@ -195,7 +281,7 @@ class Database:
             "SELECT user_id FROM games WHERE normalized = ? ORDER BY rowid",
             (normalized,),
         ).fetchall()
-        return [int(r[0]) for r in rows]
+        return [r[0] for r in rows]
 
     # --- Timezone ---
 
@@ -203,14 +289,14 @@ class Database:
         self._ensure_user(user_id)
         self.conn.execute(
             "UPDATE users SET timezone = ? WHERE user_id = ?",
-            (tz, _uid(user_id)),
+            (tz, user_id),
         )
         self.conn.commit()
 
     def get_timezone(self, user_id: int) -> str | None:
         row = self.conn.execute(
             "SELECT timezone FROM users WHERE user_id = ?",
-            (_uid(user_id),),
+            (user_id,),
         ).fetchone()
         if row and row[0]:
             return row[0]
@@ -218,11 +304,11 @@ class Database:
 
     # --- Availability ---
 
-    def _add_normal_slot(self, uid: str, day: str, start: str, end: str) -> None:
+    def _add_normal_slot(self, user_id: int, day: str, start: str, end: str) -> None:
         """Insert a single normal (non-overnight) slot, merging with existing overlaps."""
         rows = self.conn.execute(
             "SELECT id, start_time, end_time FROM availability WHERE user_id = ? AND day = ?",
-            (uid, day),
+            (user_id, day),
         ).fetchall()
 
         new_start, new_end = start, end
@@ -242,7 +328,7 @@ class Database:
 
         self.conn.execute(
             "INSERT INTO availability (user_id, day, start_time, end_time) VALUES (?, ?, ?, ?)",
-            (uid, day, new_start, new_end),
+            (user_id, day, new_start, new_end),
         )
 
     def add_day_availability(
@@ -254,21 +340,20 @@ class Database:
         if start == end:
             raise ValueError("Start and end times must differ")
         self._ensure_user(user_id)
-        uid = _uid(user_id)
 
         if start < end:
-            self._add_normal_slot(uid, day, start, end)
+            self._add_normal_slot(user_id, day, start, end)
         else:
             # Overnight: split at midnight into two normal slots
             next_day = DAY_KEYS[(DAY_KEYS.index(day) + 1) % 7]
-            self._add_normal_slot(uid, day, start, "24:00")
-            self._add_normal_slot(uid, next_day, "00:00", end)
+            self._add_normal_slot(user_id, day, start, "24:00")
+            self._add_normal_slot(user_id, next_day, "00:00", end)
 
         self.conn.commit()
 
         rows = self.conn.execute(
             "SELECT start_time, end_time FROM availability WHERE user_id = ? AND day = ? ORDER BY start_time",
-            (uid, day),
+            (user_id, day),
         ).fetchall()
         return [{"start": s, "end": e} for s, e in rows]
 
@@ -277,15 +362,23 @@ class Database:
             raise ValueError(f"Invalid day: {day!r}")
         self.conn.execute(
             "DELETE FROM availability WHERE user_id = ? AND day = ?",
-            (_uid(user_id), day),
+            (user_id, day),
         )
         self.conn.commit()
 
+    def has_any_availability(self, user_id: int) -> bool:
+        """Return True if the user has at least one slot on any day."""
+        row = self.conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM availability WHERE user_id = ?)",
+            (user_id,),
+        ).fetchone()
+        return bool(row[0])
+
     def get_availability(self, user_id: int) -> dict[str, list[dict[str, str]]]:
         result = _empty_availability()
         rows = self.conn.execute(
             "SELECT day, start_time, end_time FROM availability WHERE user_id = ? ORDER BY start_time",
-            (_uid(user_id),),
+            (user_id,),
         ).fetchall()
         for day, start, end in rows:
             if day in result:
@@ -297,9 +390,8 @@ class Database:
         tz_name = self.get_timezone(user_id)
         if not tz_name:
             return None
-        try:
-            tz = ZoneInfo(tz_name)
-        except (KeyError, ValueError):
+        tz = _zoneinfo(tz_name)
+        if tz is None:
             return None
 
         local_now = now_utc.astimezone(tz)
@@ -317,7 +409,7 @@ class Database:
 
         rows = self.conn.execute(
             "SELECT day, start_time, end_time FROM availability WHERE user_id = ? ORDER BY start_time",
-            (_uid(user_id),),
+            (user_id,),
         ).fetchall()
         if not rows:
             return None
@@ -344,33 +436,49 @@ class Database:
 
     # --- Matchmaking ---
 
-    def _available_user_ids(self, now_utc: datetime) -> set[int]:
-        """Return user IDs that are available right now."""
+    def _available_user_ids(self, now_utc: datetime, candidates: set[int] | None = None) -> set[int]:
+        """Return user IDs that are available right now.
+
+        If candidates is given, only those user IDs are considered — callers
+        that already know who could match (e.g. by shared games) avoid
+        scanning every user's availability.
+        """
         now_utc_str = now_utc.strftime("%Y-%m-%dT%H:%M")
-        rows = self.conn.execute(
+        query = (
             "SELECT u.user_id, u.timezone, a.day, a.start_time, a.end_time "
             "FROM users u "
             "JOIN availability a ON a.user_id = u.user_id "
             "WHERE u.timezone IS NOT NULL "
-            "AND (u.snooze_until IS NULL OR u.snooze_until <= ?)",
-            (now_utc_str,),
-        ).fetchall()
-
+            "AND (u.snooze_until IS NULL OR u.snooze_until <= ?)"
+        )
+        params: list[str | int] = [now_utc_str]
+        if candidates is not None:
+            if not candidates:
+                return set()
+            placeholders = ",".join("?" * len(candidates))
+            query += f" AND u.user_id IN ({placeholders})"
+            params.extend(candidates)
+        rows = self.conn.execute(query, params).fetchall()
+
+        # Users cluster into a handful of timezones, so resolve "what time is
+        # it locally" once per distinct tz rather than once per slot row.
+        local_by_tz: dict[str, tuple[str, str] | None] = {}
         available: set[int] = set()
-        for uid_str, tz_name, day, start, end in rows:
-            uid = int(uid_str)
+        for uid, tz_name, day, start, end in rows:
             if uid in available:
                 continue
-            try:
-                tz = ZoneInfo(tz_name)
-            except (KeyError, ValueError):
-                continue
-
-            local_now = now_utc.astimezone(tz)
-            if day != DAY_KEYS[local_now.weekday()]:
+            if tz_name not in local_by_tz:
+                tz = _zoneinfo(tz_name)
+                if tz is None:
+                    local_by_tz[tz_name] = None
+                else:
+                    local_now = now_utc.astimezone(tz)
+                    local_by_tz[tz_name] = (DAY_KEYS[local_now.weekday()], local_now.strftime("%H:%M"))
+            local = local_by_tz[tz_name]
+            if local is None:
                 continue
-            now_str = local_now.strftime("%H:%M")
-            if start <= now_str < end:
+            local_day, now_str = local
+            if day == local_day and start <= now_str < end:
                 available.add(uid)
 
         return available
@@ -378,39 +486,37 @@ class Database:
     def find_ready_players(
         self, invoker_id: int, now_utc: datetime, game_filter: str | None = None,
     ) -> list[tuple[int, list[str]]]:
-        available = self._available_user_ids(now_utc)
-        available.discard(invoker_id)
-
-        if not available:
-            return []
+        # Filter by shared games first: the candidate set is usually far
+        # smaller than the full user table, so the per-user timezone check
+        # only runs for users who could actually match.
+        norm_filter = normalize_game_name(game_filter) if game_filter else None
 
-        # Find common games between invoker and all available users in one query
-        placeholders = ",".join("?" * len(available))
-        params: list[str | int] = [_uid(invoker_id)]
-        params.extend(_uid(uid) for uid in available)
+        query = (
+            "SELECT b.user_id, a.game_name FROM games a "
+            "JOIN games b ON a.normalized = b.normalized "
+            "WHERE a.user_id = ? AND b.user_id != ?"
+        )
+        params: list[str | int] = [invoker_id, invoker_id]
+        if norm_filter:
+            query += " AND a.normalized = ?"
+            params.append(norm_filter)
+        query += " ORDER BY b.user_id, a.rowid"
 
-        rows = self.conn.execute(
-            f"SELECT b.user_id, a.game_name, a.normalized FROM games a "
-            f"JOIN games b ON a.normalized = b.normalized "
-            f"WHERE a.user_id = ? AND b.user_id IN ({placeholders}) "
-            f"ORDER BY b.user_id, a.rowid",
-            params,
-        ).fetchall()
+        rows = self.conn.execute(query, params).fetchall()
+        if not rows:
+            return []
 
-        norm_filter = normalize_game_name(game_filter) if game_filter else None
+        candidates = {uid for uid, _ in rows}
+        available = self._available_user_ids(now_utc, candidates)
 
-        # Group by user
+        # Group by user; ORDER BY on the INTEGER column already yields
+        # ascending user IDs, so no re-sort is needed
         results: list[tuple[int, list[str]]] = []
-        for uid_str, group in groupby(rows, key=lambda r: r[0]):
-            games = []
-            for _, game_name, normalized in group:
-                if norm_filter and normalized != norm_filter:
-                    continue
-                games.append(game_name)
-            if games:
-                results.append((int(uid_str), games))
+        for uid, group in groupby(rows, key=itemgetter(0)):
+            if uid not in available:
+                continue
+            results.append((uid, [game_name for _, game_name in group]))
 
-        results.sort(key=lambda x: x[0])
         return results
 
     # --- Stats ---
@@ -419,9 +525,23 @@ class Database:
         row = self.conn.execute("SELECT COUNT(*) FROM users").fetchone()
         return row[0] if row else 0
 
+    def _load_all_games(self) -> tuple[list[str], list[str]]:
+        if self._all_games_cache is None or self._all_games_lower is None:
+            rows = self.conn.execute(
+                "SELECT game_name FROM games GROUP BY normalized ORDER BY game_name",
+            ).fetchall()
+            self._all_games_cache = [r[0] for r in rows]
+            self._all_games_lower = [g.lower() for g in self._all_games_cache]
+        return self._all_games_cache, self._all_games_lower
+
     def all_game_names(self) -> list[str]:
         """Return one game name per normalized key, ordered alphabetically."""
-        rows = self.conn.execute(
-            "SELECT game_name FROM games GROUP BY normalized ORDER BY game_name",
-        ).fetchall()
-        return [r[0] for r in rows]
+        names, _ = self._load_all_games()
+        return list(names)
+
+    def search_game_names(self) -> tuple[list[str], list[str]]:
+        """Return the cached (names, lowercased names) catalog pair.
+
+        Both lists are shared cache state — callers must not mutate them.
+        """
+        return self._load_all_games()
@@ -15,6 +15,36 @@ def db(tmp_path: Path) -> Generator[Database, None, None]:
     d.close()
 
 
+def test_migration_converts_text_user_ids(tmp_path: Path) -> None:
+    import sqlite3
+
+    from state import _MIGRATIONS
+
+    # Build a v5-era database with TEXT user IDs and some data in it
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE schema_version (version INTEGER NOT NULL)")
+    for sql in _MIGRATIONS[:5]:
+        conn.executescript(sql)
+    conn.execute("INSERT INTO schema_version (version) VALUES (5)")
+    conn.execute("INSERT INTO users (user_id, timezone) VALUES ('123', 'UTC')")
+    conn.execute("INSERT INTO games (user_id, game_name, normalized) VALUES ('123', 'Balatro', 'balatro')")
+    conn.execute(
+        "INSERT INTO availability (user_id, day, start_time, end_time) VALUES ('123', 'mon', '18:00', '22:00')",
+    )
+    conn.commit()
+    conn.close()
+
+    d = Database(path)
+    try:
+        assert d.get_timezone(123) == "UTC"
+        assert d.list_games(123) == ["Balatro"]
+        assert d.get_availability(123)["mon"] == [{"start": "18:00", "end": "22:00"}]
+        assert d.get_users_for_game("Balatro") == [123]
+    finally:
+        d.close()
+
+
 def test_normalize_game_name_whitespace_and_case() -> None:
     raw = " HelL DiverS  2  "
     normalized = normalize_game_name(raw)
@@ -53,6 +83,17 @@ def test_list_games_returns_user_games(db: Database) -> None:
     assert db.list_games(999) == []
 
 
+def test_list_games_reflects_mutations(db: Database) -> None:
+    db.add_game(123, "Helldivers 2")
+    assert db.list_games(123) == ["Helldivers 2"]
+
+    db.add_game(123, "Balatro")
+    assert db.list_games(123) == ["Helldivers 2", "Balatro"]
+
+    db.remove_game(123, "Helldivers 2")
+    assert db.list_games(123) == ["Balatro"]
+
+
 def test_get_common_games(db: Database) -> None:
     db.add_game(123, "Helldivers 2")
     db.add_game(123, "Balatro")
@@ -101,6 +142,16 @@ def test_set_day_availability_clears(db: Database) -> None:
     assert availability["wed"] == []
 
 
+def test_has_any_availability(db: Database) -> None:
+    assert db.has_any_availability(123) is False
+
+    db.add_day_availability(123, "mon", "18:00", "22:00")
+    assert db.has_any_availability(123) is True
+
+    db.clear_day_availability(123, "mon")
+    assert db.has_any_availability(123) is False
+
+
 def test_get_availability_empty_for_missing_user(db: Database) -> None:
     availability = db.get_availability(123)
 
@@ -195,8 +246,20 @@ def test_validate_time_valid() -> None:
 def test_validate_time_invalid() -> None:
     from state import validate_time
     assert validate_time("25:00") is False
+    assert validate_time("24:01") is False
+    assert validate_time("12:60") is False
     assert validate_time("abc") is False
     assert validate_time("1800") is False
+    assert validate_time("1:00") is False
+    assert validate_time("²²:²²") is False
+
+
+def test_validate_timezone() -> None:
+    from state import validate_timezone
+    assert validate_timezone("America/New_York") is True
+    assert validate_timezone("UTC") is True
+    assert validate_timezone("Not/AZone") is False
+    assert validate_timezone("") is False
 
 
 def test_add_day_availability_merges_overlapping_slots(db: Database) -> None:
@@ -363,6 +426,26 @@ def test_all_game_names(db: Database) -> None:
     assert names == ["Balatro", "Helldivers 2"]
 
 
+def test_all_game_names_reflects_mutations(db: Database) -> None:
+    db.add_game(1, "Balatro")
+    assert db.all_game_names() == ["Balatro"]
+
+    db.add_game(2, "Helldivers 2")
+    assert db.all_game_names() == ["Balatro", "Helldivers 2"]
+
+    db.remove_game(1, "Balatro")
+    assert db.all_game_names() == ["Helldivers 2"]
+
+
+def test_search_game_names_parallel_lists(db: Database) -> None:
+    db.add_game(1, "Helldivers 2")
+    db.add_game(1, "BALATRO")
+
+    names, lowered = db.search_game_names()
+    assert names == ["BALATRO", "Helldivers 2"]
+    assert lowered == ["balatro", "helldivers 2"]
+
+
 def test_all_game_names_deduplicates_by_normalized(db: Database) -> None:
     db.add_game(1, "Helldivers 2")
     db.add_game(2, "helldivers 2")